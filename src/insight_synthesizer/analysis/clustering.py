@@ -4,10 +4,6 @@ from typing import List, Tuple, Union, Optional
 import re
 from dataclasses import dataclass
 import numpy as np
-import umap
-import hdbscan
-from sklearn.preprocessing import normalize
-from sklearn.metrics import silhouette_score
 from rich.console import Console
 from ..config import CLUSTERING_CONFIG
 from ..utils import ProgressReporter
@@ -36,6 +32,12 @@ def perform_clustering(chunks: List, progress_reporter: Optional[ProgressReporte
     Returns:
         Tuple of (updated chunks, cluster objects)
     """
+    # Heavy ML dependencies are only loaded once clustering actually runs
+    import umap
+    import hdbscan
+    from sklearn.preprocessing import normalize
+    from sklearn.metrics import silhouette_score
+    
     # Filter out conversational noise before clustering
     original_chunks = chunks
     chunks = [c for c in chunks if hasattr(c, 'text') and len(str(c.text).split()) > 15 and not re.match(r'^(yeah|yes|okay|sure|right|mhm|um|uh|thanks?|great|perfect)\.?$', str(c.text).strip(), re.I)]
@@ -43,9 +45,14 @@ def perform_clustering(chunks: List, progress_reporter: Optional[ProgressReporte
         from ..utils.progress_manager import ProgressStage
         removed = len(original_chunks) - len(chunks)
         progress_manager.log_info(f"Filtered to {len(chunks)} substantive chunks (removed {removed} noise chunks)")
-    embeddings = np.array([chunk.embedding for chunk in chunks if chunk.embedding is not None])
-    if len(embeddings) == 0:
+    embedded_chunks = [chunk for chunk in chunks if chunk.embedding is not None]
+    if not embedded_chunks:
         raise ValueError("No valid embeddings for clustering")
+    # Copy rows straight into one contiguous float32 matrix; float32 halves
+    # the memory pushed through normalisation, UMAP and HDBSCAN
+    embeddings = np.empty((len(embedded_chunks), len(embedded_chunks[0].embedding)), dtype=np.float32)
+    for row, chunk in zip(embeddings, embedded_chunks):
+        row[:] = chunk.embedding
     
     if progress_reporter:
         progress_reporter.start_process(
@@ -60,7 +67,7 @@ def perform_clustering(chunks: List, progress_reporter: Optional[ProgressReporte
             rationale="Using UMAP + HDBSCAN to identify dense groups of semantically similar content without bias"
         )
     
-    embeddings = normalize(embeddings)
+    embeddings = normalize(embeddings, copy=False)
     
     # UMAP dimensionality reduction
     if progress_manager:
@@ -107,66 +114,69 @@ def perform_clustering(chunks: List, progress_reporter: Optional[ProgressReporte
         metric=adaptive_params['metric'],
         cluster_selection_method=adaptive_params['cluster_selection_method']
     )
-    cluster_labels = clusterer.fit_predict(reduced_embeddings)
+    # int32 labels keep the grouping arrays below compact
+    cluster_labels = np.asarray(clusterer.fit_predict(reduced_embeddings), dtype=np.int32)
     
     # Calculate clustering quality metrics
-    unique_labels = set(cluster_labels)
-    noise_count = sum(1 for label in cluster_labels if label == -1)
-    valid_clusters = len(unique_labels) - (1 if -1 in unique_labels else 0)
+    unique_labels, first_index, label_inverse, label_counts = np.unique(
+        cluster_labels, return_index=True, return_inverse=True, return_counts=True
+    )
+    noise_count = int(label_counts[unique_labels == -1].sum())
+    valid_clusters = int(np.count_nonzero(unique_labels != -1))
     
     # Calculate silhouette score for quality assessment
     silhouette_avg = 0.0
-    if valid_clusters > 1 and len(set(cluster_labels)) > 1:
+    if valid_clusters > 1 and len(unique_labels) > 1:
         try:
             silhouette_avg = silhouette_score(reduced_embeddings, cluster_labels)
         except:
             silhouette_avg = 0.0
     
     # Update chunks with cluster IDs
-    valid_idx = 0
-    for chunk in chunks:
-        if chunk.embedding is not None:
-            chunk.cluster_id = int(cluster_labels[valid_idx])
-            valid_idx += 1
-    
-    # Create clusters
-    cluster_groups = {}
-    for chunk in chunks:
-        if chunk.cluster_id is not None and chunk.cluster_id != -1:
-            if chunk.cluster_id not in cluster_groups:
-                cluster_groups[chunk.cluster_id] = []
-            cluster_groups[chunk.cluster_id].append(chunk)
-    
-    clusters = [
-        Cluster(cluster_id=cid, chunks=chunks_list, size=len(chunks_list))
-        for cid, chunks_list in cluster_groups.items()
-    ]
+    for chunk, label in zip(embedded_chunks, cluster_labels.tolist()):
+        chunk.cluster_id = label
+    
+    # Create clusters by grouping chunk indices per label in one stable sort,
+    # keeping clusters in order of first appearance
+    members_by_label = np.split(np.argsort(label_inverse, kind='stable'), np.cumsum(label_counts)[:-1])
+    clusters = []
     
     # Analyze cluster composition for participant vs interviewer content and speaker distribution
     participant_clusters = 0
     speaker_diversity_clusters = 0
     total_speakers_across_clusters = set()
     
-    for cluster in clusters:
-        # Analyze speaker composition in this cluster
+    for label_idx in np.argsort(first_index, kind='stable').tolist():
+        cid = int(unique_labels[label_idx])
+        if cid == -1:
+            continue
+        
+        # Collect members and analyze their speaker composition in the same pass
+        chunks_list = []
         cluster_speakers = set()
         participant_content = 0
         interviewer_content = 0
         
-        for chunk in cluster.chunks:
-            if hasattr(chunk, '_adaptive_metadata') and chunk._adaptive_metadata:
-                speaker = chunk._adaptive_metadata.get('speaker')
-                is_interviewer = chunk._adaptive_metadata.get('is_interviewer', False)
-                
+        for i in members_by_label[label_idx].tolist():
+            chunk = embedded_chunks[i]
+            chunks_list.append(chunk)
+            metadata = getattr(chunk, '_adaptive_metadata', None)
+            if metadata:
+                speaker = metadata.get('speaker')
                 if speaker:
                     cluster_speakers.add(speaker)
-                    total_speakers_across_clusters.add(speaker)
                     
-                    if is_interviewer:
+                    if metadata.get('is_interviewer', False):
                         interviewer_content += 1
                     else:
                         participant_content += 1
         
+        cluster = Cluster(cluster_id=cid, chunks=chunks_list, size=len(chunks_list))
+        clusters.append(cluster)
+        
+        total_speakers_across_clusters |= cluster_speakers
+        has_speaker_diversity = len(cluster_speakers) > 1
+        
         # Store speaker information in cluster for later use
         cluster.speaker_metadata = {
             'speakers': list(cluster_speakers),
@@ -174,13 +184,13 @@ def perform_clustering(chunks: List, progress_reporter: Optional[ProgressReporte
             'participant_chunks': participant_content,
             'interviewer_chunks': interviewer_content,
             'is_participant_focused': participant_content >= 2,
-            'has_speaker_diversity': len(cluster_speakers) > 1
+            'has_speaker_diversity': has_speaker_diversity
         }
         
         if participant_content >= 2:  # Clusters with substantial participant content
             participant_clusters += 1
             
-        if len(cluster_speakers) > 1:  # Clusters with multiple speakers
+        if has_speaker_diversity:  # Clusters with multiple speakers
             speaker_diversity_clusters += 1
     
     if progress_manager:
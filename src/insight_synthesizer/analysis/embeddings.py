@@ -1,8 +1,6 @@
 """Embedding generation for text chunks."""
 
 from typing import List, Union, Optional
-import numpy as np
-from sentence_transformers import SentenceTransformer
 import logging
 from ..config import PROCESSING_CONFIG
 from ..utils.progress_manager import ProgressStage
@@ -13,11 +11,16 @@ logger = logging.getLogger(__name__)
 
 class TextChunk:
     """Legacy compatibility class for existing pipeline."""
+    # Slots keep per-chunk memory down and cover every attribute the
+    # pipeline attaches later (adaptive metadata, research relevance score)
+    __slots__ = ('text', 'source_file', 'embedding', 'cluster_id', '_adaptive_metadata', 'research_relevance')
+    
     def __init__(self, text: str, source_file, embedding=None, cluster_id=None):
         self.text = text
         self.source_file = source_file
         self.embedding = embedding
         self.cluster_id = cluster_id
+        self._adaptive_metadata = None
 
 
 def generate_embeddings(chunks: List[Union['AdaptiveChunk', TextChunk]], progress_manager=None) -> List[Union['AdaptiveChunk', TextChunk]]:
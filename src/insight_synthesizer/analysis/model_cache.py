@@ -1,23 +1,25 @@
 """Singleton cache for expensive models to improve performance."""
 
-from sentence_transformers import SentenceTransformer
-from typing import Optional
+from typing import Optional, TYPE_CHECKING
 import logging
 
+if TYPE_CHECKING:
+    from sentence_transformers import SentenceTransformer
+
 logger = logging.getLogger(__name__)
 
 
 class ModelCache:
     """Singleton cache for expensive models."""
     _instance = None
-    _embedding_model: Optional[SentenceTransformer] = None
+    _embedding_model: Optional['SentenceTransformer'] = None
     
     def __new__(cls):
         if cls._instance is None:
             cls._instance = super().__new__(cls)
         return cls._instance
     
-    def get_embedding_model(self, model_name: str = 'all-MiniLM-L6-v2') -> SentenceTransformer:
+    def get_embedding_model(self, model_name: str = 'all-MiniLM-L6-v2') -> 'SentenceTransformer':
         """
         Get or create cached embedding model.
         
@@ -28,6 +30,8 @@ class ModelCache:
             Cached SentenceTransformer instance
         """
         if self._embedding_model is None:
+            # Deferred so importing the package doesn't pull in torch
+            from sentence_transformers import SentenceTransformer
             logger.info(f"Loading embedding model {model_name} (one-time cost)...")
             self._embedding_model = SentenceTransformer(model_name)
             logger.info(f"Embedding model {model_name} loaded successfully")
@@ -51,7 +55,7 @@ class ModelCache:
 _model_cache = ModelCache()
 
 
-def get_embedding_model(model_name: str = 'all-MiniLM-L6-v2') -> SentenceTransformer:
+def get_embedding_model(model_name: str = 'all-MiniLM-L6-v2') -> 'SentenceTransformer':
     """
     Convenience function to get cached embedding model.
     
@@ -7,6 +7,7 @@ from typing import Dict, List, Optional, TYPE_CHECKING
 import subprocess
 import shutil
 import platform
+from collections import Counter
 from rich.console import Console
 from ..config import LLM_CONFIG, ANALYSIS_LENSES
 
@@ -39,7 +40,7 @@ def synthesize_insights(cluster, lens: str, goal_manager: Optional['ResearchGoal
     from ..llm.client import get_llm_client
     # Collect quotes with speaker information
     quotes_with_speakers = []
-    speaker_distribution = {}
+    speaker_distribution = Counter()
     
     for chunk in cluster.chunks:
         speaker = None
@@ -50,7 +51,7 @@ def synthesize_insights(cluster, lens: str, goal_manager: Optional['ResearchGoal
             # Track speaker distribution
             if speaker:
                 speaker_key = f"{speaker} ({'Interviewer' if is_interviewer else 'Participant'})"
-                speaker_distribution[speaker_key] = speaker_distribution.get(speaker_key, 0) + 1
+                speaker_distribution[speaker_key] += 1
         
         if speaker:
             quotes_with_speakers.append(f"[{speaker}]: {chunk.text}")
@@ -180,10 +181,9 @@ Be specific and evidence-based. Focus on patterns and insights from the data."""
     legacy_required = ['theme_name', 'summary', 'key_insights']
     if all(key in synthesis for key in legacy_required):
         if 'speaker_distribution' not in synthesis:
-            synthesis['speaker_distribution'] = speaker_distribution
+            synthesis['speaker_distribution'] = dict(speaker_distribution)
         if 'primary_contributors' not in synthesis:
-            contributors = list(speaker_distribution.keys()) if speaker_distribution else []
-            synthesis['primary_contributors'] = [str(c) for c in contributors[:3]]
+            synthesis['primary_contributors'] = [speaker for speaker, _ in speaker_distribution.most_common(3)]
         if 'cross_speaker_patterns' not in synthesis:
             synthesis['cross_speaker_patterns'] = "Multiple speakers contributed to this theme" if len(speaker_distribution) > 1 else "Single speaker theme"
         return synthesis
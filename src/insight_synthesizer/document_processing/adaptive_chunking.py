@@ -1,6 +1,8 @@
 """Adaptive Chunking Strategies for Research Data"""
 
 import re
+import sys
+from functools import lru_cache
 from typing import List, Dict, Optional
 from pathlib import Path
 from dataclasses import dataclass
@@ -9,6 +11,63 @@ from ..config import PROCESSING_CONFIG
 from ..utils import ProgressReporter
 from ..utils.progress_reporter import ProcessType
 
+# Transcript clean-up applied before speaker detection
+_TIMESTAMP_RE = re.compile(r'###\s*\d{2}:\d{2}:\d{2}\s*\n?')
+_MEETING_END_RE = re.compile(r'###\s*Meeting ended.*', re.MULTILINE)
+_PAUSE_LINE_RE = re.compile(r'^\s*\.\.\.\s*', re.MULTILINE)
+_BLANK_RUN_RE = re.compile(r'\n{3,}')
+_INLINE_ELLIPSIS_RE = re.compile(r'\s*\.\.\.\s*')
+
+# Enhanced speaker patterns - ordered by specificity
+_SPEAKER_PATTERNS = [
+    re.compile(pattern, re.MULTILINE | re.DOTALL)
+    for pattern in (
+        # Pattern 1: Names with special characters (hyphens, periods, apostrophes)
+        r"([A-Za-z][A-Za-z\s\-.']+?):\s*([^:]+?)(?=\n[A-Za-z][^:]*?:|$)",
+        # Pattern 2: Full names "First Last: content"
+        r'([A-Z][a-z]+(?:\s+[A-Z][a-z]+)+)\s*:\s*([^:]+?)(?=\n[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*\s*:|$)',
+        # Pattern 3: Standard "Name: content" format (fallback)
+        r'([^\n:]+?):\s*([^:]+?)(?=\n[^\n:]+?:|$)',
+        # Pattern 4: ALL CAPS "INTERVIEWER: content"
+        r'([A-Z]{2,})\s*:\s*([^:]+?)(?=\n[A-Z]{2,}\s*:|$)',
+        # Pattern 5: Markdown bold "**Name**: content"
+        r'(\*\*[^*]+\*\*)\s*:\s*([^:]+?)(?=\n\*\*[^*]+\*\*\s*:|$)',
+    )
+]
+
+_MD_BOLD_RE = re.compile(r'\*\*([^*]+)\*\*')
+_PAREN_RE = re.compile(r'\([^)]*\)')
+
+_INTERVIEWER_INDICATORS = (
+    'interviewer', 'alex', 'researcher', 'moderator',
+    'juli', 'lanzillotta'  # Add common interviewer names from your transcripts
+)
+_INTERVIEWER_RE = re.compile('|'.join(map(re.escape, _INTERVIEWER_INDICATORS)))
+
+# Line classifiers for meta-content vs actual research data
+_META_INDICATORS = [
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in (
+        r'creating|developing|crafting|establishing|outlining',
+        r'persona|framework|structure|methodology',
+        r'next step|moving on|focus on',
+        r'I\'m|I\'ve|I will|My next',
+    )
+]
+
+_RESEARCH_INDICATORS = [
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in (
+        r'interviewer:|interviewee:|alex:|dr\.|professor',
+        r'thank you|appreciate|experience|frustrated',
+        r'what|how|why|when|where',
+        r'student|research|paper|assignment',
+    )
+]
+
+_PARAGRAPH_SPLIT_RE = re.compile(r'\n\s*\n')
+_SENTENCE_SPLIT_RE = re.compile(r'(?<=[.!?])\s+')
+
 
 @dataclass 
 class AdaptiveChunk:
@@ -94,43 +153,32 @@ class AdaptiveChunker:
         
         # Pre-process to remove common artifacts that could interfere
         # Remove timestamp markers but keep the content
-        text = re.sub(r'###\s*\d{2}:\d{2}:\d{2}\s*\n?', '\n', text)
-        text = re.sub(r'###\s*Meeting ended.*', '', text, flags=re.MULTILINE)
+        text = _TIMESTAMP_RE.sub('\n', text)
+        text = _MEETING_END_RE.sub('', text)
         
         # Remove standalone ellipsis lines that are just pauses
-        text = re.sub(r'^\s*\.\.\.\s*', '', text, flags=re.MULTILINE)
+        text = _PAUSE_LINE_RE.sub('', text)
         
         # Remove multiple blank lines
-        text = re.sub(r'\n{3,}', '\n\n', text)
+        text = _BLANK_RUN_RE.sub('\n\n', text)
         
-        # Enhanced speaker patterns - ordered by specificity
-        speaker_patterns = [
-            # Pattern 1: Names with special characters (hyphens, periods, apostrophes)
-            r"([A-Za-z][A-Za-z\s\-.']+?):\s*([^:]+?)(?=\n[A-Za-z][^:]*?:|$)",
-            # Pattern 2: Full names "First Last: content"
-            r'([A-Z][a-z]+(?:\s+[A-Z][a-z]+)+)\s*:\s*([^:]+?)(?=\n[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*\s*:|$)',
-            # Pattern 3: Standard "Name: content" format (fallback)
-            r'([^\n:]+?):\s*([^:]+?)(?=\n[^\n:]+?:|$)',
-            # Pattern 4: ALL CAPS "INTERVIEWER: content"  
-            r'([A-Z]{2,})\s*:\s*([^:]+?)(?=\n[A-Z]{2,}\s*:|$)',
-            # Pattern 5: Markdown bold "**Name**: content"
-            r'(\*\*[^*]+\*\*)\s*:\s*([^:]+?)(?=\n\*\*[^*]+\*\*\s*:|$)',
-        ]
+        # Every speaker pattern needs a "Name:" separator; skip the scans when there is none
+        if ':' not in text:
+            return self._chunk_by_sentences(text, file_path, classification)
         
         # Try each pattern until we find one that works
-        best_pattern = None
         best_matches = []
         
-        for pattern in speaker_patterns:
-            matches = re.findall(pattern, text, re.MULTILINE | re.DOTALL)
+        for pattern in _SPEAKER_PATTERNS:
+            matches = pattern.findall(text)
             if matches and len(matches) > len(best_matches):
-                best_pattern = pattern
                 best_matches = matches
         
         if best_matches:
-            # Group contiguous blocks from the same speaker into full turns
-            processed_turns = []
+            # Group contiguous blocks from the same speaker into full turns,
+            # emitting each chunk as soon as the speaker changes
             current_speaker = None
+            current_name = None
             current_content_parts = []
 
             for speaker, content in best_matches:
@@ -138,47 +186,44 @@ class AdaptiveChunker:
                 if not content:
                     continue
                 # Normalize ellipses and excessive whitespace inside turns
-                content = re.sub(r'\s*\.\.\.\s*', ' ', content)
+                content = _INLINE_ELLIPSIS_RE.sub(' ', content)
+                name = self._clean_speaker_name(speaker)
 
-                if current_speaker is None:
-                    current_speaker = speaker
-                    current_content_parts = [content]
-                elif self._clean_speaker_name(speaker) == self._clean_speaker_name(current_speaker):
+                if current_speaker is not None and name == current_name:
                     # Same speaker continues; append content
                     current_content_parts.append(content)
-                else:
-                    # Speaker changed; finalize previous turn
-                    combined = "\n\n".join(part for part in current_content_parts if part)
-                    if combined:
-                        processed_turns.append((current_speaker, combined))
-                    # Start new turn
-                    current_speaker = speaker
-                    current_content_parts = [content]
+                    continue
 
-            # Flush the last accumulated turn
-            if current_content_parts:
-                combined = "\n\n".join(part for part in current_content_parts if part)
-                if combined:
-                    processed_turns.append((current_speaker, combined))
+                # Speaker changed; finalize previous turn
+                if current_speaker is not None:
+                    chunks.append(self._speaker_turn_chunk(current_speaker, current_name, current_content_parts, file_path))
+                # Start new turn
+                current_speaker = speaker
+                current_name = name
+                current_content_parts = [content]
 
-            # Create chunks from processed turns so each chunk is a full uninterrupted response
-            for speaker, combined_text in processed_turns:
-                chunks.append(AdaptiveChunk(
-                    text=combined_text,
-                    source_file=file_path,
-                    chunk_type="speaker_turn",
-                    metadata={
-                        "speaker": self._clean_speaker_name(speaker),
-                        "is_interviewer": self._is_interviewer(speaker),
-                        "content_type": "dialogue"
-                    }
-                ))
+            # Flush the last accumulated turn
+            if current_speaker is not None:
+                chunks.append(self._speaker_turn_chunk(current_speaker, current_name, current_content_parts, file_path))
         else:
             # Fallback if no speaker patterns found
             return self._chunk_by_sentences(text, file_path, classification)
         
         return chunks
     
+    def _speaker_turn_chunk(self, speaker: str, name: str, parts: List[str], file_path: Path) -> AdaptiveChunk:
+        """Build one chunk holding a full uninterrupted response."""
+        return AdaptiveChunk(
+            text="\n\n".join(parts),
+            source_file=file_path,
+            chunk_type="speaker_turn",
+            metadata={
+                "speaker": name,
+                "is_interviewer": self._is_interviewer(speaker),
+                "content_type": "dialogue"
+            }
+        )
+    
     def _chunk_by_content_separation(self, text: str, file_path: Path, classification: StructureClassification) -> List[AdaptiveChunk]:
         """Separate meta-content from research data."""
         chunks = []
@@ -188,28 +233,14 @@ class AdaptiveChunker:
         current_section = []
         current_type = "unknown"
         
-        meta_indicators = [
-            r'creating|developing|crafting|establishing|outlining',
-            r'persona|framework|structure|methodology',
-            r'next step|moving on|focus on',
-            r'I\'m|I\'ve|I will|My next'
-        ]
-        
-        research_indicators = [
-            r'interviewer:|interviewee:|alex:|dr\.|professor',
-            r'thank you|appreciate|experience|frustrated',
-            r'what|how|why|when|where',
-            r'student|research|paper|assignment'
-        ]
-        
         for line in lines:
             line = line.strip()
             if not line:
                 continue
             
             # Classify line as meta-content or research data
-            meta_score = sum(1 for pattern in meta_indicators if re.search(pattern, line, re.IGNORECASE))
-            research_score = sum(1 for pattern in research_indicators if re.search(pattern, line, re.IGNORECASE))
+            meta_score = sum(1 for pattern in _META_INDICATORS if pattern.search(line))
+            research_score = sum(1 for pattern in _RESEARCH_INDICATORS if pattern.search(line))
             
             line_type = "meta" if meta_score > research_score else "research"
             
@@ -252,7 +283,7 @@ class AdaptiveChunker:
         chunks = []
         
         # Split by paragraphs (double newline or clear breaks)
-        paragraphs = re.split(r'\n\s*\n', text)
+        paragraphs = _PARAGRAPH_SPLIT_RE.split(text)
         
         current_chunk = []
         current_length = 0
@@ -311,7 +342,7 @@ class AdaptiveChunker:
     def _chunk_by_sentences(self, text: str, file_path: Path, classification: StructureClassification) -> List[AdaptiveChunk]:
         """Fallback sentence-based chunking."""
         chunks = []
-        sentences = re.split(r'(?<=[.!?])\s+', text)
+        sentences = _SENTENCE_SPLIT_RE.split(text)
         
         current_chunk = []
         current_length = 0
@@ -358,7 +389,7 @@ class AdaptiveChunker:
     def _split_long_content(self, content: str, speaker: str) -> List[str]:
         """Split long speaker content while preserving meaning."""
         # Try to split at sentence boundaries first
-        sentences = re.split(r'(?<=[.!?])\s+', content)
+        sentences = _SENTENCE_SPLIT_RE.split(content)
         chunks = []
         current_chunk = []
         current_length = 0
@@ -377,18 +408,23 @@ class AdaptiveChunker:
         
         return chunks
     
-    def _clean_speaker_name(self, speaker: str) -> str:
+    @staticmethod
+    @lru_cache(maxsize=512)
+    def _clean_speaker_name(speaker: str) -> str:
         """Clean up speaker name for consistent identification."""
         # Remove markdown, parentheses content, etc.
-        cleaned = re.sub(r'\*\*([^*]+)\*\*', r'\1', speaker)  # Remove **bold**
-        cleaned = re.sub(r'\([^)]*\)', '', cleaned).strip()   # Remove (role)
-        return cleaned
+        # Plain names skip the regex passes entirely
+        cleaned = speaker
+        if '**' in cleaned:
+            cleaned = _MD_BOLD_RE.sub(r'\1', cleaned)  # Remove **bold**
+        if '(' in cleaned:
+            cleaned = _PAREN_RE.sub('', cleaned)   # Remove (role)
+        cleaned = cleaned.strip()
+        # Intern so every chunk from the same speaker shares one string
+        return sys.intern(cleaned)
     
-    def _is_interviewer(self, speaker: str) -> bool:
+    @staticmethod
+    @lru_cache(maxsize=512)
+    def _is_interviewer(speaker: str) -> bool:
         """Determine if speaker is likely the interviewer."""
-        interviewer_indicators = [
-            'interviewer', 'alex', 'researcher', 'moderator',
-            'juli', 'lanzillotta'  # Add common interviewer names from your transcripts
-        ]
-        speaker_lower = speaker.lower()
-        return any(indicator in speaker_lower for indicator in interviewer_indicators)
\ No newline at end of file
+        return _INTERVIEWER_RE.search(speaker.lower()) is not None
\ No newline at end of file
@@ -1,5 +1,6 @@
 """File handling utilities for various document formats."""
 
+import os
 from pathlib import Path
 from typing import List
 from ..config import PROCESSING_CONFIG
@@ -47,9 +48,14 @@ def find_supported_files(directory: Path) -> List[Path]:
     Returns:
         List of supported file paths, sorted by name
     """
+    supported = tuple(PROCESSING_CONFIG['supported_extensions'])
     files = []
-    for ext in PROCESSING_CONFIG['supported_extensions']:
-        files.extend(directory.glob(f"*{ext}"))
+    # One directory listing instead of a glob per extension; endswith matches
+    # the same names glob('*.ext') did, dotfiles included
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if entry.name.endswith(supported) and entry.is_file():
+                files.append(Path(entry.path))
     return sorted(files)
 
 
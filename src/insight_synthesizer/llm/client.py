@@ -18,9 +18,25 @@ from typing import Dict, Optional, List, Any
 from dataclasses import dataclass
 from rich.console import Console
 
+try:
+    import orjson
+except ImportError:  # optional: faster parsing of LLM JSON responses
+    orjson = None
+
 console = Console()
 
 
+def _loads(data: Any) -> Any:
+    """Parse JSON with orjson when available, keeping stdlib semantics on failure."""
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # stdlib accepts a few extensions (NaN, Infinity) and reports the error
+            pass
+    return json.loads(data)
+
+
 @dataclass
 class LLMResponse:
     """Standard response from any LLM."""
@@ -170,6 +186,8 @@ class UnifiedLLMClient:
             self.provider = 'ollama'
             self.model = model_name
             self.base_url = 'http://localhost:11434'
+            # Reuse one keep-alive connection for every generation request
+            self.session = requests.Session()
             
             console.print(f"[yellow]✓ Using Ollama ({self.model}) - will be slower[/]")
             return True
@@ -255,8 +273,6 @@ class UnifiedLLMClient:
                         temperature: float, max_tokens: int,
                         json_mode: bool) -> LLMResponse:
         """Generate using Ollama."""
-        import requests
-        
         full_prompt = f"{system}\n\n{prompt}" if system else prompt
         
         # Cap prediction length for local models to avoid long-running generations
@@ -285,7 +301,7 @@ class UnifiedLLMClient:
             timeout_seconds = int(os.environ.get('OLLAMA_TIMEOUT', '300'))
         except ValueError:
             timeout_seconds = 300
-        response = requests.post(
+        response = self.session.post(
             f"{self.base_url}/api/generate",
             json=payload,
             timeout=timeout_seconds
@@ -293,7 +309,7 @@ class UnifiedLLMClient:
         response.raise_for_status()
         
         return LLMResponse(
-            content=response.json()["response"],
+            content=_loads(response.content)["response"],
             model_used=self.model,
             provider='ollama',
             response_time=time.time() - start_time,
@@ -335,7 +351,7 @@ class UnifiedLLMClient:
             return False, {"error": response.error}
         
         try:
-            data = json.loads(response.content)
+            data = _loads(response.content)
             return True, data
         except json.JSONDecodeError as e:
             return False, {"error": f"Invalid JSON: {e}", "raw": response.content}
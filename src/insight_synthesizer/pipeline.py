@@ -2,7 +2,6 @@
 
 from typing import List, Dict
 from pathlib import Path
-import numpy as np
 from rich.console import Console
 
 from .document_processing import (
@@ -4,7 +4,6 @@ from dataclasses import dataclass
 from typing import List, Dict, Optional, Tuple
 import numpy as np
 import logging
-from sentence_transformers import SentenceTransformer
 try:
     from rich.console import Console
 except Exception:
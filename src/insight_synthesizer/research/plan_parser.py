@@ -5,14 +5,89 @@ Location: src/insight_synthesizer/research/plan_parser.py
 
 import re
 import json
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Optional, Set, Tuple
 from dataclasses import dataclass
 import requests
 from rich.console import Console
 
 console = Console()
 
+_FLAGS = re.IGNORECASE | re.MULTILINE
+
+# Pattern library for common research document structures, compiled once at import
+_PLAN_PATTERNS = {
+    'questions': [
+        re.compile(r'(?:research\s+)?questions?:?\s*\n((?:[-•*\d]+\.?\s*.+\n?)+)', _FLAGS),
+        re.compile(r'RQ\d+:?\s*(.+)', _FLAGS),
+        re.compile(r'(?:key\s+)?questions?\s+to\s+answer:?\s*\n((?:[-•*\d]+\.?\s*.+\n?)+)', _FLAGS),
+        re.compile(r'what\s+we\s+want\s+to\s+learn:?\s*\n((?:[-•*\d]+\.?\s*.+\n?)+)', _FLAGS),
+    ],
+    'background': [
+        re.compile(r'background:?\s*\n(.+(?:\n.+)*)', _FLAGS),
+        re.compile(r'context:?\s*\n(.+(?:\n.+)*)', _FLAGS),
+        re.compile(r'introduction:?\s*\n(.+(?:\n.+)*)', _FLAGS),
+    ],
+    'goals': [
+        re.compile(r'(?:research\s+)?goals?:?\s*\n(.+(?:\n.+)*)', _FLAGS),
+        re.compile(r'objectives?:?\s*\n(.+(?:\n.+)*)', _FLAGS),
+        re.compile(r'purpose:?\s*\n(.+(?:\n.+)*)', _FLAGS),
+    ],
+    'assumptions': [
+        re.compile(r'assumptions?:?\s*\n((?:[-•*\d]+\.?\s*.+\n?)+)', _FLAGS),
+        re.compile(r'we\s+(?:assume|believe)\s+that:?\s*\n((?:[-•*\d]+\.?\s*.+\n?)+)', _FLAGS),
+    ],
+    'hypotheses': [
+        re.compile(r'hypothes[ei]s:?\s*\n((?:[-•*\d]+\.?\s*.+\n?)+)', _FLAGS),
+        re.compile(r'H\d+:?\s*(.+)', _FLAGS),
+        re.compile(r'we\s+(?:expect|predict)\s+that:?\s*\n((?:[-•*\d]+\.?\s*.+\n?)+)', _FLAGS),
+    ],
+    'methodology': [
+        re.compile(r'method(?:ology)?:?\s*\n(.+(?:\n.+)*)', _FLAGS),
+        re.compile(r'approach:?\s*\n(.+(?:\n.+)*)', _FLAGS),
+        re.compile(r'how\s+we\s+will\s+conduct:?\s*\n(.+(?:\n.+)*)', _FLAGS),
+    ]
+}
+
+_LIST_MARKER_RE = re.compile(r'^[-•*\d]+\.?\s*')
+
+# Confidence for single-value fields by source: (pattern match, LLM extraction)
+_FIELD_CONFIDENCE = {
+    'background': (0.9, 0.7),
+    'research_goal': (0.9, 0.7),
+}
+
+# Leading goal phrases and the question words that replace them
+_GOAL_QUESTION_PREFIXES = (
+    ('to understand', 'What'),
+    ('to identify', 'What are'),
+    ('to determine', 'How'),
+)
+
+# Keywords every pattern in a section requires; one scan tells us which sections to try.
+# No two keywords can start at the same character, so each match names exactly one section.
+_SECTION_KEYWORD_RE = re.compile(
+    r'(?P<questions>question|rq\d|learn)'
+    r'|(?P<background>background|context|introduction)'
+    r'|(?P<goals>goal|objective|purpose)'
+    r'|(?P<assumptions>assum|believe)'
+    r'|(?P<hypotheses>hypothes|h\d|expect|predict)'
+    r'|(?P<methodology>method|approach|conduct)',
+    re.IGNORECASE
+)
+
+
+def _find_sections(content: str) -> Set[str]:
+    """Return the sections whose keywords appear in the content, in a single left-to-right scan."""
+    sections = set()
+    match = _SECTION_KEYWORD_RE.search(content)
+    while match and len(sections) < len(_PLAN_PATTERNS):
+        sections.add(match.lastgroup)
+        # Resume one character in so keywords overlapping this one (e.g. "approach1") are seen
+        match = _SECTION_KEYWORD_RE.search(content, match.start() + 1)
+    return sections
+
 
 @dataclass
 class ParsedResearchPlan:
@@ -52,40 +127,6 @@ class ResearchPlanParser:
             'model_name': 'mistral',
             'timeout': 60
         }
-        
-        # Pattern library for common research document structures
-        self.patterns = {
-            'questions': [
-                r'(?:research\s+)?questions?:?\s*\n((?:[-•*\d]+\.?\s*.+\n?)+)',
-                r'RQ\d+:?\s*(.+)',
-                r'(?:key\s+)?questions?\s+to\s+answer:?\s*\n((?:[-•*\d]+\.?\s*.+\n?)+)',
-                r'what\s+we\s+want\s+to\s+learn:?\s*\n((?:[-•*\d]+\.?\s*.+\n?)+)',
-            ],
-            'background': [
-                r'background:?\s*\n((?:.+\n?)+?)(?=\n[A-Z]|\n\n|\Z)',
-                r'context:?\s*\n((?:.+\n?)+?)(?=\n[A-Z]|\n\n|\Z)',
-                r'introduction:?\s*\n((?:.+\n?)+?)(?=\n[A-Z]|\n\n|\Z)',
-            ],
-            'goals': [
-                r'(?:research\s+)?goals?:?\s*\n((?:.+\n?)+?)(?=\n[A-Z]|\n\n|\Z)',
-                r'objectives?:?\s*\n((?:.+\n?)+?)(?=\n[A-Z]|\n\n|\Z)',
-                r'purpose:?\s*\n((?:.+\n?)+?)(?=\n[A-Z]|\n\n|\Z)',
-            ],
-            'assumptions': [
-                r'assumptions?:?\s*\n((?:[-•*\d]+\.?\s*.+\n?)+)',
-                r'we\s+(?:assume|believe)\s+that:?\s*\n((?:[-•*\d]+\.?\s*.+\n?)+)',
-            ],
-            'hypotheses': [
-                r'hypothes[ei]s:?\s*\n((?:[-•*\d]+\.?\s*.+\n?)+)',
-                r'H\d+:?\s*(.+)',
-                r'we\s+(?:expect|predict)\s+that:?\s*\n((?:[-•*\d]+\.?\s*.+\n?)+)',
-            ],
-            'methodology': [
-                r'method(?:ology)?:?\s*\n((?:.+\n?)+?)(?=\n[A-Z]|\n\n|\Z)',
-                r'approach:?\s*\n((?:.+\n?)+?)(?=\n[A-Z]|\n\n|\Z)',
-                r'how\s+we\s+will\s+conduct:?\s*\n((?:.+\n?)+?)(?=\n[A-Z]|\n\n|\Z)',
-            ]
-        }
     
     def parse_document(self, file_path: Path) -> ParsedResearchPlan:
         """
@@ -104,7 +145,20 @@ class ResearchPlanParser:
         except Exception as e:
             raise ValueError(f"Could not read research plan: {e}")
         
-        console.print(f"[cyan]Parsing research plan: {file_path.name}[/]")
+        return self.parse_text(content, file_path.name)
+    
+    def parse_text(self, content: str, label: str = "provided text") -> ParsedResearchPlan:
+        """
+        Parse research plan text that is already in memory.
+        
+        Args:
+            content: Full text of the research plan
+            label: Name shown in progress output
+            
+        Returns:
+            Parsed research plan with confidence scores
+        """
+        console.print(f"[cyan]Parsing research plan: {label}[/]")
         
         # Step 1: Pattern-based extraction for structured content
         pattern_results = self._extract_with_patterns(content)
@@ -116,83 +170,56 @@ class ResearchPlanParser:
         merged_plan = self._merge_results(pattern_results, llm_results, content)
         
         # Step 4: Validate and clean
-        final_plan = self._validate_and_clean(merged_plan)
-        
-        return final_plan
+        return self._validate_and_clean(merged_plan)
     
     def _extract_with_patterns(self, content: str) -> ParsedResearchPlan:
         """Extract information using regex patterns."""
         plan = ParsedResearchPlan()
         
         # Normalize content for better pattern matching
-        content = re.sub(r'\r\n', '\n', content)  # Normalize line endings
-        
-        # Extract research questions
-        questions = []
-        for pattern in self.patterns['questions']:
-            matches = re.finditer(pattern, content, re.IGNORECASE | re.MULTILINE)
-            for match in matches:
-                text = match.group(1) if match.groups() else match.group(0)
-                # Split into individual questions
-                lines = text.strip().split('\n')
-                for line in lines:
-                    clean = re.sub(r'^[-•*\d]+\.?\s*', '', line.strip())
-                    if clean and len(clean) > 10:  # Min length for valid question
-                        questions.append(clean)
-        
-        plan.research_questions = self._deduplicate_list(questions)
-        
-        # Extract background
-        for pattern in self.patterns['background']:
-            match = re.search(pattern, content, re.IGNORECASE | re.MULTILINE)
-            if match:
-                plan.background = match.group(1).strip()
-                break
+        content = content.replace('\r\n', '\n')  # Normalize line endings
         
-        # Extract goals
-        for pattern in self.patterns['goals']:
-            match = re.search(pattern, content, re.IGNORECASE | re.MULTILINE)
-            if match:
-                plan.research_goal = match.group(1).strip()
-                break
-        
-        # Extract assumptions
-        assumptions = []
-        for pattern in self.patterns['assumptions']:
-            matches = re.finditer(pattern, content, re.IGNORECASE | re.MULTILINE)
-            for match in matches:
-                text = match.group(1)
-                lines = text.strip().split('\n')
-                for line in lines:
-                    clean = re.sub(r'^[-•*\d]+\.?\s*', '', line.strip())
-                    if clean and len(clean) > 10:
-                        assumptions.append(clean)
-        
-        plan.assumptions = self._deduplicate_list(assumptions)
-        
-        # Extract hypotheses
-        hypotheses = []
-        for pattern in self.patterns['hypotheses']:
-            matches = re.finditer(pattern, content, re.IGNORECASE | re.MULTILINE)
-            for match in matches:
-                text = match.group(1) if match.groups() else match.group(0)
-                lines = text.strip().split('\n')
-                for line in lines:
-                    clean = re.sub(r'^[-•*\d]+\.?\s*', '', line.strip())
-                    if clean and len(clean) > 10:
-                        hypotheses.append(clean)
-        
-        plan.hypotheses = self._deduplicate_list(hypotheses)
-        
-        # Extract methodology
-        for pattern in self.patterns['methodology']:
-            match = re.search(pattern, content, re.IGNORECASE | re.MULTILINE)
-            if match:
-                plan.methodology = match.group(1).strip()
-                break
+        # Find which sections the document can contain, so we only run their patterns
+        sections = _find_sections(content)
+        if not sections:
+            return plan  # No section keywords at all, e.g. free-form notes
+        
+        plan.research_questions = self._extract_list_items(content, 'questions', sections)
+        plan.background = self._extract_block(content, 'background', sections)
+        plan.research_goal = self._extract_block(content, 'goals', sections)
+        plan.assumptions = self._extract_list_items(content, 'assumptions', sections)
+        plan.hypotheses = self._extract_list_items(content, 'hypotheses', sections)
+        plan.methodology = self._extract_block(content, 'methodology', sections)
         
         return plan
     
+    def _extract_list_items(self, content: str, section: str, sections: Set[str]) -> List[str]:
+        """Collect list items (questions, assumptions, ...) matched by a section's patterns."""
+        if section not in sections:
+            return []
+        
+        items = []
+        for pattern in _PLAN_PATTERNS[section]:
+            for match in pattern.finditer(content):
+                # Split into individual items
+                for line in match.group(1).strip().split('\n'):
+                    clean = _LIST_MARKER_RE.sub('', line.strip())
+                    if clean and len(clean) > 10:  # Min length for a valid item
+                        items.append(clean)
+        
+        return self._deduplicate_list(items)
+    
+    def _extract_block(self, content: str, section: str, sections: Set[str]) -> Optional[str]:
+        """Return the text block under the first matching header for a section."""
+        if section not in sections:
+            return None
+        
+        for pattern in _PLAN_PATTERNS[section]:
+            match = pattern.search(content)
+            if match:
+                return match.group(1).strip()
+        return None
+    
     def _extract_with_llm(self, content: str) -> ParsedResearchPlan:
         """Use LLM for intelligent extraction."""
         from ..llm.client import get_llm_client
@@ -274,37 +301,21 @@ Be thorough - extract ALL research questions you find, even if they're phrased d
             confidence.get('questions_llm', 0)
         )
         
-        # Background - prefer pattern if found, else LLM
-        if pattern_plan.background:
-            merged.background = pattern_plan.background
-            confidence['background'] = 0.9
-        elif llm_plan.background:
-            merged.background = llm_plan.background
-            confidence['background'] = 0.7
-        
-        # Research goal
-        if pattern_plan.research_goal:
-            merged.research_goal = pattern_plan.research_goal
-            confidence['research_goal'] = 0.9
-        elif llm_plan.research_goal:
-            merged.research_goal = llm_plan.research_goal
-            confidence['research_goal'] = 0.7
-        
-        # Assumptions - combine
-        all_assumptions = []
-        if pattern_plan.assumptions:
-            all_assumptions.extend(pattern_plan.assumptions)
-        if llm_plan.assumptions:
-            all_assumptions.extend(llm_plan.assumptions)
-        merged.assumptions = self._deduplicate_list(all_assumptions)
-        
-        # Hypotheses - combine
-        all_hypotheses = []
-        if pattern_plan.hypotheses:
-            all_hypotheses.extend(pattern_plan.hypotheses)
-        if llm_plan.hypotheses:
-            all_hypotheses.extend(llm_plan.hypotheses)
-        merged.hypotheses = self._deduplicate_list(all_hypotheses)
+        # Background and goal - prefer pattern if found, else LLM
+        for field, (pattern_conf, llm_conf) in _FIELD_CONFIDENCE.items():
+            pattern_value = getattr(pattern_plan, field)
+            llm_value = getattr(llm_plan, field)
+            if pattern_value:
+                setattr(merged, field, pattern_value)
+                confidence[field] = pattern_conf
+            elif llm_value:
+                setattr(merged, field, llm_value)
+                confidence[field] = llm_conf
+        
+        # Assumptions and hypotheses - combine
+        for field in ('assumptions', 'hypotheses'):
+            combined = (getattr(pattern_plan, field) or []) + (getattr(llm_plan, field) or [])
+            setattr(merged, field, self._deduplicate_list(combined))
         
         # Methodology
         merged.methodology = pattern_plan.methodology or llm_plan.methodology
@@ -322,11 +333,14 @@ Be thorough - extract ALL research questions you find, even if they're phrased d
         seen = set()
         result = []
         for item in items:
-            # Normalize for comparison
-            normalized = re.sub(r'\s+', ' ', item.lower().strip())
-            if normalized not in seen and len(item.strip()) > 10:
+            item = item.strip()
+            if len(item) <= 10:
+                continue
+            # Normalize case and whitespace for comparison
+            normalized = ' '.join(item.lower().split())
+            if normalized not in seen:
                 seen.add(normalized)
-                result.append(item.strip())
+                result.append(item)
         return result
     
     def _validate_and_clean(self, plan: ParsedResearchPlan) -> ParsedResearchPlan:
@@ -359,7 +373,9 @@ Be thorough - extract ALL research questions you find, even if they're phrased d
         
         return plan
     
-    def _goal_to_question(self, goal: str) -> Optional[str]:
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def _goal_to_question(goal: str) -> Optional[str]:
         """Convert a goal statement to a question format."""
         goal = goal.strip()
         
@@ -368,14 +384,11 @@ Be thorough - extract ALL research questions you find, even if they're phrased d
             return goal
         
         # Convert statements to questions
-        if goal.lower().startswith('to understand'):
-            return goal.replace('To understand', 'What').replace('to understand', 'what') + '?'
-        elif goal.lower().startswith('to identify'):
-            return goal.replace('To identify', 'What are').replace('to identify', 'what are') + '?'
-        elif goal.lower().startswith('to determine'):
-            return goal.replace('To determine', 'How').replace('to determine', 'how') + '?'
-        else:
-            return f"How can we {goal.lower()}?"
+        lowered = goal.lower()
+        for prefix, question_word in _GOAL_QUESTION_PREFIXES:
+            if lowered.startswith(prefix):
+                return question_word + goal[len(prefix):] + '?'
+        return f"How can we {lowered}?"
     
     def display_parsed_plan(self, plan: ParsedResearchPlan) -> None:
         """Display the parsed plan for user confirmation."""
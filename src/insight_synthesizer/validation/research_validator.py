@@ -268,34 +268,35 @@ class ResearchCoverageValidator:
             
         # Question-type specific gap analysis
         if 'why' in question_lower:
-            has_reasons = any(
-                any(word in str(synthesis_results[t_idx]).lower() 
-                    for word in ['reason', 'because', 'due to', 'cause'])
-                for t_idx in addressing_themes
-            )
-            if not has_reasons:
+            if not self._themes_mention(synthesis_results, addressing_themes,
+                                        ['reason', 'because', 'due to', 'cause']):
                 gaps.append("Question asks 'why' but themes don't explain root causes")
                 
         elif 'how' in question_lower:
-            has_process = any(
-                any(word in str(synthesis_results[t_idx]).lower() 
-                    for word in ['process', 'method', 'approach', 'way', 'step'])
-                for t_idx in addressing_themes
-            )
-            if not has_process:
+            if not self._themes_mention(synthesis_results, addressing_themes,
+                                        ['process', 'method', 'approach', 'way', 'step']):
                 gaps.append("Question asks 'how' but themes don't describe processes or methods")
                 
         elif 'what' in question_lower and 'barrier' in question_lower:
-            has_barriers = any(
-                any(word in str(synthesis_results[t_idx]).lower() 
-                    for word in ['barrier', 'challenge', 'difficult', 'prevent', 'obstacle'])
-                for t_idx in addressing_themes
-            )
-            if not has_barriers:
+            if not self._themes_mention(synthesis_results, addressing_themes,
+                                        ['barrier', 'challenge', 'difficult', 'prevent', 'obstacle']):
                 gaps.append("Question asks about barriers but themes don't identify specific obstacles")
                 
         return gaps
     
+    def _themes_mention(self, synthesis_results: List[Dict], addressing_themes: List[int],
+                        words: List[str]) -> bool:
+        """Check whether any addressing theme mentions one of the keywords.
+        
+        Each theme is lower-cased only when reached, so the scan stops at the
+        first theme that matches.
+        """
+        for t_idx in addressing_themes:
+            text = str(synthesis_results[t_idx]).lower()
+            if any(word in text for word in words):
+                return True
+        return False
+    
     def _generate_recommendations(self, coverage_by_question: List[QuestionCoverage],
                                  synthesis_results: List[Dict]) -> List[str]:
         """
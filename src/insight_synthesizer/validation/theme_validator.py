@@ -5,7 +5,6 @@ import re
 from typing import Dict, List, Tuple, Optional
 from dataclasses import dataclass
 from pathlib import Path
-import requests
 from rich.console import Console
 from ..config import LLM_CONFIG
 from ..utils import ProgressReporter
@@ -14,8 +13,12 @@ from ..llm.client import get_llm_client
 
 console = Console()
 
+# Long transcripts are scanned in overlapping windows for quote extraction
+_QUOTE_CHUNK_SIZE = 6000
+_QUOTE_CHUNK_OVERLAP = 1000
 
-@dataclass
+
+@dataclass(slots=True)
 class QuoteEvidence:
     """Individual quote with source attribution."""
     text: str
@@ -25,7 +28,7 @@ class QuoteEvidence:
     context: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ThemeCoverage:
     """Coverage analysis for a single theme."""
     theme_name: str
@@ -36,7 +39,7 @@ class ThemeCoverage:
     distribution_quality: str  # "excellent", "good", "limited", "poor"
 
 
-@dataclass
+@dataclass(slots=True)
 class ValidationResult:
     """Complete validation results for all themes."""
     theme_coverages: List[ThemeCoverage]
@@ -160,18 +163,15 @@ class ThemeValidator:
         quotes = []
         
         # Process in chunks if content is long
-        CHUNK_SIZE = 6000
-        OVERLAP = 1000
-        
-        if len(content) <= CHUNK_SIZE:
+        if len(content) <= _QUOTE_CHUNK_SIZE:
             # Process normally for short content
             quotes.extend(self._extract_quotes_chunk(
                 theme_name, theme_summary, content, filename, 0
             ))
         else:
             # Process in overlapping chunks for long content
-            for i in range(0, len(content), CHUNK_SIZE - OVERLAP):
-                chunk = content[i:i + CHUNK_SIZE]
+            for i in range(0, len(content), _QUOTE_CHUNK_SIZE - _QUOTE_CHUNK_OVERLAP):
+                chunk = content[i:i + _QUOTE_CHUNK_SIZE]
                 chunk_quotes = self._extract_quotes_chunk(
                     theme_name, theme_summary, chunk, filename, i
                 )
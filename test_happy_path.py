@@ -64,15 +64,11 @@ def test_happy_path():
     start_time = time.time()
     synthesizer = InsightSynthesizer()
     
-    try:
-        report_path = synthesizer.analyze_files(
-            sample_files,
-            lens="pain_points",
-            research_goals=plan
-        )
-    except Exception as e:
-        print(f"❌ Pipeline failed: {e}")
-        return False
+    report_path = synthesizer.analyze_files(
+        sample_files,
+        lens="pain_points",
+        research_goals=plan
+    )
     
     elapsed = time.time() - start_time
     
@@ -0,0 +1,39 @@
+from pathlib import Path
+
+import pytest
+
+
+PLANS = Path(__file__).resolve().parent.parent / 'test_data' / 'research_plans'
+
+
+@pytest.fixture
+def parser(monkeypatch: pytest.MonkeyPatch) -> 'ResearchPlanParser':
+    from src.insight_synthesizer.research.plan_parser import ParsedResearchPlan, ResearchPlanParser
+    
+    # Pattern extraction only; an empty LLM result is what a failed LLM call yields
+    monkeypatch.setattr(ResearchPlanParser, '_extract_with_llm',
+                        lambda self, content: ParsedResearchPlan())
+    return ResearchPlanParser()
+
+
+def test_parse_text_formal_plan(parser: 'ResearchPlanParser') -> None:
+    plan = parser.parse_text((PLANS / 'formal_plan.txt').read_text())
+    assert len(plan.research_questions) == 5
+    assert plan.research_questions[0] == (
+        'At which specific steps in the checkout process are users most likely '
+        'to abandon their carts?'
+    )
+    assert plan.research_goal.startswith(
+        'To understand the factors contributing to high cart abandonment rates and identify'
+    )
+    assert len(plan.assumptions) == 4
+    assert len(plan.hypotheses) == 3
+
+
+def test_parse_text_goal_becomes_question(parser: 'ResearchPlanParser') -> None:
+    plan = parser.parse_text(
+        "Research Goal:\n"
+        "To identify the blockers new users hit during onboarding\n"
+    )
+    assert plan.research_goal == 'To identify the blockers new users hit during onboarding'
+    assert plan.research_questions == ['What are the blockers new users hit during onboarding?']
@@ -1,186 +1,164 @@
 #!/usr/bin/env python3
 """Verify that all fixes have been implemented correctly."""
 
+import argparse
 import os
+import sys
+from functools import lru_cache
 from pathlib import Path
 
-# ANSI color codes
-GREEN = '\033[92m'
-RED = '\033[91m'
-YELLOW = '\033[93m'
-RESET = '\033[0m'
-BOLD = '\033[1m'
+# ANSI color codes, dropped when output is redirected to a file or CI log
+_TTY = sys.stdout.isatty()
+GREEN = '\033[92m' if _TTY else ''
+RED = '\033[91m' if _TTY else ''
+YELLOW = '\033[93m' if _TTY else ''
+RESET = '\033[0m' if _TTY else ''
+BOLD = '\033[1m' if _TTY else ''
+
+# Report lines are collected and written to stdout in one go at the end of main()
+_report_lines = []
+
+def _emit(line):
+    """Queue a line of report output."""
+    _report_lines.append(f"{line}\n")
+
+@lru_cache(maxsize=None)
+def _dir_entries(directory):
+    """List a directory once so sibling existence checks share one scan."""
+    try:
+        with os.scandir(directory) as entries:
+            # is_file/is_dir follow symlinks, so dangling links count as missing
+            return frozenset(e.name for e in entries if e.is_file() or e.is_dir())
+    except OSError:
+        return frozenset()
 
 def check_file_exists(filepath, description):
     """Check if a file exists and report."""
-    if Path(filepath).exists():
-        print(f"{GREEN}✅{RESET} {description}: {filepath}")
+    filepath = Path(filepath)
+    # The listing match is case-sensitive; fall back to exists() so names that
+    # differ only in case still resolve on case-insensitive filesystems
+    if filepath.name in _dir_entries(str(filepath.parent)) or filepath.exists():
+        _emit(f"{GREEN}✅{RESET} {description}: {filepath}")
         return True
     else:
-        print(f"{RED}❌{RESET} {description}: {filepath}")
+        _emit(f"{RED}❌{RESET} {description}: {filepath}")
         return False
 
+@lru_cache(maxsize=None)
+def _read_file(filepath):
+    """Read a file's bytes once; several checks look inside the same file."""
+    return Path(filepath).read_bytes()
+
 def check_content_in_file(filepath, content, description):
-    """Check if content exists in file."""
+    """Check if content (a bytes needle) exists in file."""
     try:
-        with open(filepath, 'r') as f:
-            file_content = f.read()
-            if content in file_content:
-                print(f"{GREEN}✅{RESET} {description}")
-                return True
-            else:
-                print(f"{RED}❌{RESET} {description}")
-                return False
+        if content in _read_file(str(filepath)):
+            _emit(f"{GREEN}✅{RESET} {description}")
+            return True
+        else:
+            _emit(f"{RED}❌{RESET} {description}")
+            return False
     except Exception as e:
-        print(f"{RED}❌{RESET} Error checking {description}: {e}")
+        _emit(f"{RED}❌{RESET} Error checking {description}: {e}")
         return False
 
-def main():
-    print(f"\n{BOLD}=== VERIFICATION OF IMPLEMENTED FIXES ==={RESET}\n")
-    
-    base_dir = Path(__file__).parent
-    src_dir = base_dir / "src" / "insight_synthesizer"
-    
-    all_checks_passed = True
-    
+BASE_DIR = Path(__file__).parent
+SRC_DIR = BASE_DIR / "src" / "insight_synthesizer"
+
+# (heading, checks) pairs; each check is (check_fn, *args). Paths are built once at import.
+_VERIFICATION_SECTIONS = [
     # Fix #0: Research Plan Parser
-    print(f"{BOLD}Research Plan Parser (NEW):{RESET}")
-    all_checks_passed &= check_file_exists(
-        src_dir / "research" / "plan_parser.py",
-        "Research plan parser module"
-    )
-    all_checks_passed &= check_file_exists(
-        base_dir / "tests" / "test_research_plan_parser.py",
-        "Parser tests"
-    )
-    all_checks_passed &= check_file_exists(
-        base_dir / "test_data" / "research_plans" / "formal_plan.txt",
-        "Sample research plans"
-    )
-    
+    ("Research Plan Parser (NEW):", [
+        (check_file_exists, SRC_DIR / "research" / "plan_parser.py", "Research plan parser module"),
+        (check_file_exists, BASE_DIR / "tests" / "test_research_plan_parser.py", "Parser tests"),
+        (check_file_exists, BASE_DIR / "test_data" / "research_plans" / "formal_plan.txt", "Sample research plans"),
+    ]),
     # Fix #1: Research Questions Field Harmonization
-    print(f"\n{BOLD}Fix #1 - Research Questions Field Harmonization:{RESET}")
-    all_checks_passed &= check_content_in_file(
-        src_dir / "research" / "goal_manager.py",
-        "from_parsed_plan",
-        "Added from_parsed_plan class method"
-    )
-    all_checks_passed &= check_content_in_file(
-        src_dir / "research" / "goal_manager.py",
-        "self.primary_questions = self.research_questions",
-        "Field synchronization in __post_init__"
-    )
-    
+    ("Fix #1 - Research Questions Field Harmonization:", [
+        (check_content_in_file, SRC_DIR / "research" / "goal_manager.py", b"from_parsed_plan", "Added from_parsed_plan class method"),
+        (check_content_in_file, SRC_DIR / "research" / "goal_manager.py", b"self.primary_questions = self.research_questions", "Field synchronization in __post_init__"),
+    ]),
     # Fix #2: Validation Content Truncation
-    print(f"\n{BOLD}Fix #2 - Validation Content Chunking:{RESET}")
-    all_checks_passed &= check_content_in_file(
-        src_dir / "validation" / "theme_validator.py",
-        "_extract_quotes_chunk",
-        "Added chunk-based extraction method"
-    )
-    all_checks_passed &= check_content_in_file(
-        src_dir / "validation" / "theme_validator.py",
-        "CHUNK_SIZE = 6000",
-        "Chunk size configuration"
-    )
-    
+    ("Fix #2 - Validation Content Chunking:", [
+        (check_content_in_file, SRC_DIR / "validation" / "theme_validator.py", b"_extract_quotes_chunk", "Added chunk-based extraction method"),
+        (check_content_in_file, SRC_DIR / "validation" / "theme_validator.py", b"_QUOTE_CHUNK_SIZE = 6000", "Chunk size configuration"),
+    ]),
     # Fix #3: Adaptive Clustering Parameters
-    print(f"\n{BOLD}Fix #3 - Adaptive Clustering Parameters:{RESET}")
-    all_checks_passed &= check_content_in_file(
-        src_dir / "analysis" / "clustering_utils.py",
-        "get_adaptive_clustering_params",
-        "Added adaptive parameter function"
-    )
-    all_checks_passed &= check_content_in_file(
-        src_dir / "analysis" / "clustering.py",
-        "get_adaptive_clustering_params",
-        "Using adaptive parameters in clustering"
-    )
-    
+    ("Fix #3 - Adaptive Clustering Parameters:", [
+        (check_content_in_file, SRC_DIR / "analysis" / "clustering_utils.py", b"get_adaptive_clustering_params", "Added adaptive parameter function"),
+        (check_content_in_file, SRC_DIR / "analysis" / "clustering.py", b"get_adaptive_clustering_params", "Using adaptive parameters in clustering"),
+    ]),
     # Fix #4: Singleton Embedding Model
-    print(f"\n{BOLD}Fix #4 - Singleton Embedding Model Cache:{RESET}")
-    all_checks_passed &= check_file_exists(
-        src_dir / "analysis" / "model_cache.py",
-        "Model cache module"
-    )
-    all_checks_passed &= check_content_in_file(
-        src_dir / "analysis" / "embeddings.py",
-        "get_embedding_model",
-        "Using cached model in embeddings"
-    )
-    
+    ("Fix #4 - Singleton Embedding Model Cache:", [
+        (check_file_exists, SRC_DIR / "analysis" / "model_cache.py", "Model cache module"),
+        (check_content_in_file, SRC_DIR / "analysis" / "embeddings.py", b"get_embedding_model", "Using cached model in embeddings"),
+    ]),
     # Fix #5: Memory Leak Prevention
-    print(f"\n{BOLD}Fix #5 - Memory Leak Prevention:{RESET}")
-    all_checks_passed &= check_content_in_file(
-        src_dir / "research" / "goal_manager.py",
-        "MAX_CACHE_SIZE = 1000",
-        "Cache size limit"
-    )
-    all_checks_passed &= check_content_in_file(
-        src_dir / "research" / "goal_manager.py",
-        "Pruned relevance cache",
-        "Cache pruning logic"
-    )
-    
+    ("Fix #5 - Memory Leak Prevention:", [
+        (check_content_in_file, SRC_DIR / "research" / "goal_manager.py", b"MAX_CACHE_SIZE = 1000", "Cache size limit"),
+        (check_content_in_file, SRC_DIR / "research" / "goal_manager.py", b"Pruned relevance cache", "Cache pruning logic"),
+    ]),
     # Fix #6: Smart Ollama Manager
-    print(f"\n{BOLD}Fix #6 - Smart Ollama Manager:{RESET}")
-    all_checks_passed &= check_file_exists(
-        src_dir / "analysis" / "ollama_manager.py",
-        "Ollama manager module"
-    )
-    all_checks_passed &= check_content_in_file(
-        src_dir / "analysis" / "synthesis.py",
-        "OllamaManager",
-        "Using OllamaManager in synthesis"
-    )
-    
+    ("Fix #6 - Smart Ollama Manager:", [
+        (check_file_exists, SRC_DIR / "analysis" / "ollama_manager.py", "Ollama manager module"),
+        (check_content_in_file, SRC_DIR / "analysis" / "synthesis.py", b"OllamaManager", "Using OllamaManager in synthesis"),
+    ]),
     # Fix #7: Updated Requirements
-    print(f"\n{BOLD}Fix #7 - Updated Dependencies:{RESET}")
-    all_checks_passed &= check_content_in_file(
-        base_dir / "requirements.txt",
-        "psutil",
-        "Added psutil for process management"
-    )
-    all_checks_passed &= check_content_in_file(
-        base_dir / "requirements.txt",
-        "faiss-cpu",
-        "Added FAISS for vector search"
-    )
-    
+    ("Fix #7 - Updated Dependencies:", [
+        (check_content_in_file, BASE_DIR / "requirements.txt", b"psutil", "Added psutil for process management"),
+        (check_content_in_file, BASE_DIR / "requirements.txt", b"faiss-cpu", "Added FAISS for vector search"),
+    ]),
     # CLI Integration
-    print(f"\n{BOLD}CLI Integration:{RESET}")
-    all_checks_passed &= check_content_in_file(
-        src_dir / "cli.py",
-        "ResearchPlanParser",
-        "Parser import in CLI"
-    )
-    all_checks_passed &= check_content_in_file(
-        src_dir / "cli.py",
-        "Do you have a research plan document",
-        "Research plan prompt"
-    )
+    ("CLI Integration:", [
+        (check_content_in_file, SRC_DIR / "cli.py", b"ResearchPlanParser", "Parser import in CLI"),
+        (check_content_in_file, SRC_DIR / "cli.py", b"Do you have a research plan document", "Research plan prompt"),
+    ]),
+]
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--fail-fast", action="store_true",
+                        help="stop at the first failed check instead of running them all")
+    args = parser.parse_args()
+    
+    _emit(f"\n{BOLD}=== VERIFICATION OF IMPLEMENTED FIXES ==={RESET}\n")
+    
+    all_checks_passed = True
+    
+    for index, (heading, checks) in enumerate(_VERIFICATION_SECTIONS):
+        separator = "\n" if index else ""
+        _emit(f"{separator}{BOLD}{heading}{RESET}")
+        for check, *check_args in checks:
+            if not check(*check_args):
+                all_checks_passed = False
+                if args.fail_fast:
+                    break
+        if not all_checks_passed and args.fail_fast:
+            break
     
     # Summary
-    print(f"\n{BOLD}{'='*60}{RESET}")
+    _emit(f"\n{BOLD}{'='*60}{RESET}")
     if all_checks_passed:
-        print(f"{GREEN}{BOLD}✅ ALL FIXES VERIFIED SUCCESSFULLY!{RESET}")
-        print(f"\n{BOLD}Summary of Implemented Fixes:{RESET}")
-        print(f"{GREEN}✅{RESET} Research Plan Parser - Automatic document ingestion")
-        print(f"{GREEN}✅{RESET} Fix #1 - Research questions field harmonization")
-        print(f"{GREEN}✅{RESET} Fix #2 - Validation handles long documents (>8KB)")
-        print(f"{GREEN}✅{RESET} Fix #3 - Adaptive clustering for small datasets")
-        print(f"{GREEN}✅{RESET} Fix #4 - Singleton embedding model cache (10x faster)")
-        print(f"{GREEN}✅{RESET} Fix #5 - Memory leak prevention with cache limits")
-        print(f"{GREEN}✅{RESET} Fix #6 - Smart Ollama server management")
-        print(f"{GREEN}✅{RESET} Fix #7 - Updated dependencies in requirements.txt")
+        _emit(f"{GREEN}{BOLD}✅ ALL FIXES VERIFIED SUCCESSFULLY!{RESET}")
+        _emit(f"\n{BOLD}Summary of Implemented Fixes:{RESET}")
+        _emit(f"{GREEN}✅{RESET} Research Plan Parser - Automatic document ingestion")
+        _emit(f"{GREEN}✅{RESET} Fix #1 - Research questions field harmonization")
+        _emit(f"{GREEN}✅{RESET} Fix #2 - Validation handles long documents (>8KB)")
+        _emit(f"{GREEN}✅{RESET} Fix #3 - Adaptive clustering for small datasets")
+        _emit(f"{GREEN}✅{RESET} Fix #4 - Singleton embedding model cache (10x faster)")
+        _emit(f"{GREEN}✅{RESET} Fix #5 - Memory leak prevention with cache limits")
+        _emit(f"{GREEN}✅{RESET} Fix #6 - Smart Ollama server management")
+        _emit(f"{GREEN}✅{RESET} Fix #7 - Updated dependencies in requirements.txt")
     else:
-        print(f"{RED}{BOLD}❌ SOME VERIFICATIONS FAILED{RESET}")
-        print("Please check the output above for details.")
+        _emit(f"{RED}{BOLD}❌ SOME VERIFICATIONS FAILED{RESET}")
+        _emit("Please check the output above for details.")
+    
+    _emit(f"\n{BOLD}Next Steps:{RESET}")
+    _emit("1. Install dependencies: pip install -r requirements.txt")
+    _emit("2. Run the parser tests: python -m pytest tests/test_research_plan_parser.py")
+    _emit("3. Test with a research plan: python synthesizer.py")
     
-    print(f"\n{BOLD}Next Steps:{RESET}")
-    print("1. Install dependencies: pip install -r requirements.txt")
-    print("2. Run the parser tests: python -m pytest tests/test_research_plan_parser.py")
-    print("3. Test with a research plan: python synthesizer.py")
+    sys.stdout.write("".join(_report_lines))
 
 if __name__ == "__main__":
     main()
\ No newline at end of file